@@ -8,8 +8,9 @@ as well as packet transmission and reception.
 
 import gc
 import machine
+import micropython
 from machine import SPI, Pin
-from utime import ticks_ms, sleep_ms  # ticks_ms and sleep_ms imported from utime
+from utime import ticks_ms, ticks_diff, sleep_ms  # timing helpers imported from utime
 from micropython import const
 
 # ============================================================================
@@ -69,6 +70,12 @@ IRQ_PAYLOAD_CRC_ERROR_MASK = const(0x20)
 IRQ_RX_DONE_MASK        = const(0x40)
 IRQ_RX_TIME_OUT_MASK    = const(0x80)
 
+# ============================================================================
+# DIO Mapping (REG_DIO_MAPPING_1 bits 7:6 select the DIO0 source)
+# ============================================================================
+DIO0_RX_DONE            = const(0x00)
+DIO0_TX_DONE            = const(0x40)
+
 # ============================================================================
 # IQ Inversion Constants
 # ============================================================================
@@ -87,6 +94,25 @@ RFLR_INVERTIQ2_OFF      = const(0x1D)
 MAX_PKT_LENGTH = const(255)
 FifoTxBaseAddr = const(0x00)
 FifoRxBaseAddr = const(0x00)
+MODE_READY_TIMEOUT_MS = const(10)
+DIO0_FALLBACK_MS = const(100)
+
+# Prebuilt one-byte SPI headers for FIFO bursts
+FIFO_WRITE_HEADER = bytes([REG_FIFO | 0x80])
+FIFO_READ_HEADER = bytes([REG_FIFO & 0x7F])
+
+# Signal bandwidth bins (Hz) and their MODEM_CONFIG_1 BW index
+SIGNAL_BANDWIDTH_BINS = (7800, 10400, 15600, 20800, 31250, 41700, 62500, 125000, 250000)
+SIGNAL_BANDWIDTH_INDEX = {bw: i for i, bw in enumerate(SIGNAL_BANDWIDTH_BINS)}
+
+# Registers the chip updates on its own; never served from the shadow cache
+VOLATILE_REGISTERS = {
+    REG_FIFO, REG_OP_MODE, REG_FIFO_ADDR_PTR, REG_FIFO_RX_CURRENT_ADDR,
+    REG_IRQ_FLAGS, REG_RX_NB_BYTES, REG_PKT_SNR_VALUE, REG_PKT_RSSI_VALUE,
+    REG_FIFO_RX_BYTE_ADDR, REG_RSSI_WIDEBAND,
+}
+# Same information indexed by address, for lookups on every register write
+VOLATILE_REGISTER_FLAGS = bytearray(1 if a in VOLATILE_REGISTERS else 0 for a in range(128))
 
 # ============================================================================
 # Default LoRa Parameters
@@ -105,6 +131,22 @@ DEFAULT_PARAMETERS = {
     "invert_IQ": False,
 }
 
+# ============================================================================
+# Native Helpers
+# ============================================================================
+@micropython.native
+def _frf(frequency):
+    """
+    Convert a frequency to the SX127x FRF register value.
+    
+    frf = f * 2^19 / 32 MHz = f * 256 / 15625, split so that every
+    intermediate stays a small int (no bignum allocation).
+    
+    :param frequency: Frequency in Hz.
+    :return: 24-bit FRF value.
+    """
+    return ((frequency // 15625) << 8) + (((frequency % 15625) << 8) // 15625)
+
 # ============================================================================
 # ULoRa Class Definition
 # ============================================================================
@@ -123,6 +165,21 @@ class ULoRa:
         """
         self.spi = spi
         self.pins = pins
+        # Preallocated 2-byte (address, data) SPI frame buffers
+        self._tx = bytearray(2)
+        self._rx = bytearray(2)
+        # Address header for register bursts
+        self._hdr = bytearray(1)
+        # Preallocated FIFO receive buffer
+        self._fifo_buf = bytearray(MAX_PKT_LENGTH)
+        # Shadow copy of configuration registers, indexed by address, and a
+        # map of which entries hold a known value
+        self._shadow = bytearray(128)
+        self._shadow_valid = bytearray(128)
+        # Addresses written while batching, flushed as bursts (None = off)
+        self._deferred = None
+        self._last_frf = None
+        self._frf_buf = bytearray(3)
         self.parameters = DEFAULT_PARAMETERS.copy()
         if parameters:
             self.parameters.update(parameters)
@@ -137,8 +194,17 @@ class ULoRa:
         else:
             self.pin_reset = None
         
+        # Setup DIO0 pin if provided; its rising edge signals TX/RX done
+        self._dio0_event = False
+        if "dio0" in self.pins:
+            self.pin_dio0 = Pin(self.pins["dio0"], Pin.IN)
+            self.pin_dio0.irq(trigger=Pin.IRQ_RISING, handler=self._on_dio0)
+        else:
+            self.pin_dio0 = None
+        
         self.lock = False
         self.implicit_header_mode = None
+        self._tx_len = 0
         
         # Check LoRa module version
         version = None
@@ -153,15 +219,24 @@ class ULoRa:
         else:
             print("LoRa Connection OK! Version: {}".format(version))
         
-        # Put module in sleep mode for configuration
-        self.sleep()
+        # Put module in sleep mode for configuration; registers written
+        # before the mode change has taken effect would be lost
+        for _ in range(5):
+            if self.sleep(wait=True):
+                break
+        else:
+            print("LoRa module did not enter sleep mode!")
+            machine.reset()
+        
+        # Collect configuration writes and send adjacent registers as bursts
+        self._deferred = set()
         
         # Configure LoRa parameters
         self.set_frequency(self.parameters["frequency"])
         self.set_signal_bandwidth(self.parameters["signal_bandwidth"])
         
         # Enable LNA boost and auto AGC
-        self.write_register(REG_LNA, self.read_register(REG_LNA) | 0x03)
+        self.write_register(REG_LNA, self._read_shadow(REG_LNA) | 0x03)
         self.write_register(REG_MODEM_CONFIG_3, 0x04)
         
         self.set_tx_power(self.parameters["tx_power_level"])
@@ -177,12 +252,13 @@ class ULoRa:
         bw = self.parameters["signal_bandwidth"]
         sf = self.parameters["spreading_factor"]
         if (1000 / bw / (2 ** sf)) > 16:
-            self.write_register(REG_MODEM_CONFIG_3, self.read_register(REG_MODEM_CONFIG_3) | 0x08)
+            self.write_register(REG_MODEM_CONFIG_3, self._read_shadow(REG_MODEM_CONFIG_3) | 0x08)
         
         # Set FIFO base addresses
         self.write_register(REG_FIFO_TX_BASE_ADDR, FifoTxBaseAddr)
         self.write_register(REG_FIFO_RX_BASE_ADDR, FifoRxBaseAddr)
         
+        self._flush_deferred()
         self.standby()
     
     def reset_module(self):
@@ -191,11 +267,14 @@ class ULoRa:
         """
         if self.pin_reset is None:
             return
-        # Drive reset pin low for 100ms then high
+        # Register contents return to their defaults
+        self._shadow_valid = bytearray(128)
+        self._last_frf = None
+        # Datasheet: hold reset low for >100us, then allow 5ms until ready
         self.pin_reset.value(0)
-        sleep_ms(100)
+        sleep_ms(1)
         self.pin_reset.value(1)
-        sleep_ms(100)
+        sleep_ms(5)
     
     # ---------------------------
     # Packet Transmission Methods
@@ -209,36 +288,57 @@ class ULoRa:
         self.standby()
         if implicit_header is not None:
             self.set_implicit_header(implicit_header)
-        # Reset FIFO pointer and payload length
+        # Reset FIFO pointer and payload length (written out in end_packet)
         self.write_register(REG_FIFO_ADDR_PTR, FifoTxBaseAddr)
-        self.write_register(REG_PAYLOAD_LENGTH, 0)
+        self._tx_len = 0
     
     def write(self, buffer):
         """
         Write data to the LoRa FIFO.
         
-        :param buffer: Data bytes (or bytearray) to be sent.
+        :param buffer: Data bytes, bytearray or memoryview to be sent.
         :return: Number of bytes written.
         """
-        current_length = self.read_register(REG_PAYLOAD_LENGTH)
+        current_length = self._tx_len
         size = len(buffer)
         # Ensure packet does not exceed maximum allowed length
         size = min(size, MAX_PKT_LENGTH - FifoTxBaseAddr - current_length)
-        for byte in buffer:
-            self.write_register(REG_FIFO, byte)
-        # Update payload length
-        self.write_register(REG_PAYLOAD_LENGTH, current_length + size)
+        if size < len(buffer):
+            # Zero-copy truncation
+            buffer = memoryview(buffer)[:size]
+        # Push the whole payload in one burst (FIFO pointer auto-increments)
+        self._fifo_write_burst(buffer)
+        self._tx_len = current_length + size
         return size
     
     def end_packet(self):
         """
         Transmit the packet and wait until transmission is complete.
         """
-        # Set module to TX mode
-        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_TX)
-        # Wait until TX_DONE flag is set
-        while (self.read_register(REG_IRQ_FLAGS) & IRQ_TX_DONE_MASK) == 0:
-            pass
+        # Payload length accumulated by write()
+        self.write_register(REG_PAYLOAD_LENGTH, self._tx_len)
+        if self.pin_dio0 is not None:
+            # Clear a latched TX_DONE so DIO0 is low before it is armed
+            self.write_register(REG_IRQ_FLAGS, IRQ_TX_DONE_MASK)
+            # Route TX_DONE to DIO0 and idle until its interrupt fires
+            self.write_register(REG_DIO_MAPPING_1, DIO0_TX_DONE)
+            self._dio0_event = False
+            self._set_mode(MODE_TX, wait=False)
+            last_check = ticks_ms()
+            while not self._dio0_event:
+                machine.idle()
+                # Once per DIO0_FALLBACK_MS, check the flag in case the edge was missed
+                now = ticks_ms()
+                if ticks_diff(now, last_check) >= DIO0_FALLBACK_MS:
+                    last_check = now
+                    if self.read_register(REG_IRQ_FLAGS) & IRQ_TX_DONE_MASK:
+                        break
+        else:
+            # Set module to TX mode
+            self._set_mode(MODE_TX, wait=False)
+            # Wait until TX_DONE flag is set
+            while (self.read_register(REG_IRQ_FLAGS) & IRQ_TX_DONE_MASK) == 0:
+                pass
         # Clear TX_DONE flag
         self.write_register(REG_IRQ_FLAGS, IRQ_TX_DONE_MASK)
     
@@ -256,7 +356,6 @@ class ULoRa:
         self.write(message)
         for _ in range(repeat):
             self.end_packet()
-        self.collect_garbage()
     
     # ---------------------------
     # Packet Reception Methods
@@ -270,7 +369,13 @@ class ULoRa:
         self.set_implicit_header(size > 0)
         if size > 0:
             self.write_register(REG_PAYLOAD_LENGTH, size & 0xFF)
-        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_RX_CONTINUOUS)
+        if self.pin_dio0 is not None:
+            # Clear latched flags so DIO0 drops and the next RX_DONE gives an edge
+            self.write_register(REG_IRQ_FLAGS, 0xFF)
+            # Route RX_DONE to DIO0
+            self.write_register(REG_DIO_MAPPING_1, DIO0_RX_DONE)
+            self._dio0_event = False
+        self._set_mode(MODE_RX_CONTINUOUS, wait=False)
     
     def listen(self, timeout=1000):
         """
@@ -279,32 +384,53 @@ class ULoRa:
         :param timeout: Timeout in milliseconds.
         :return: Received payload as bytes, or None if timeout occurs.
         """
+        if self.pin_dio0 is not None and (
+                self._dio0_event or self.read_register(REG_IRQ_FLAGS) & IRQ_RX_DONE_MASK):
+            # A packet arrived since the last call; take it before receive()
+            # clears the flags
+            self._dio0_event = False
+            irq_flags = self.get_irq_flags()
+            if irq_flags & IRQ_RX_DONE_MASK and not irq_flags & IRQ_PAYLOAD_CRC_ERROR_MASK:
+                return self.read_payload()
         self.receive()
         start = ticks_ms()
         while True:
-            if self.received_packet():
+            if self.pin_dio0 is not None:
+                # Idle until DIO0 signals RX_DONE instead of polling over SPI
+                if self._dio0_event:
+                    self._dio0_event = False
+                    # ValidHeader (and others) may be set alongside RX_DONE
+                    irq_flags = self.get_irq_flags()
+                    if irq_flags & IRQ_RX_DONE_MASK and not irq_flags & IRQ_PAYLOAD_CRC_ERROR_MASK:
+                        return self.read_payload()
+                else:
+                    machine.idle()
+            elif self.received_packet():
                 return self.read_payload()
-            if ticks_ms() - start > timeout:
+            if ticks_diff(ticks_ms(), start) > timeout:
                 return None
     
-    def received_packet(self, size=0):
+    def received_packet(self, size=None):
         """
         Check if a packet has been received.
         
-        :param size: Expected payload size. If >0, uses implicit header mode.
+        :param size: (Optional) Expected payload size. If >0, uses implicit
+                     header mode; 0 selects explicit header mode. If None,
+                     keeps the mode configured by receive(size).
         :return: True if a packet is received, otherwise False.
         """
         irq_flags = self.get_irq_flags()
-        self.set_implicit_header(size > 0)
-        if size > 0:
-            self.write_register(REG_PAYLOAD_LENGTH, size & 0xFF)
-        if irq_flags == IRQ_RX_DONE_MASK:
+        if size is not None:
+            self.set_implicit_header(size > 0)
+            if size > 0 and self._read_shadow(REG_PAYLOAD_LENGTH) != size & 0xFF:
+                self.write_register(REG_PAYLOAD_LENGTH, size & 0xFF)
+        if irq_flags & IRQ_RX_DONE_MASK and not irq_flags & IRQ_PAYLOAD_CRC_ERROR_MASK:
             return True
         else:
             # If not in single RX mode, reset FIFO pointer and enter single RX mode
             if self.read_register(REG_OP_MODE) != (MODE_LONG_RANGE_MODE | MODE_RX_SINGLE):
                 self.write_register(REG_FIFO_ADDR_PTR, FifoRxBaseAddr)
-                self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_RX_SINGLE)
+                self._set_mode(MODE_RX_SINGLE, wait=False)
         return False
     
     def read_payload(self):
@@ -320,10 +446,7 @@ class ULoRa:
             packet_length = self.read_register(REG_PAYLOAD_LENGTH)
         else:
             packet_length = self.read_register(REG_RX_NB_BYTES)
-        payload = bytearray()
-        for _ in range(packet_length):
-            payload.append(self.read_register(REG_FIFO))
-        self.collect_garbage()
+        payload = self._fifo_read_burst(packet_length)
         return bytes(payload)
     
     def get_irq_flags(self):
@@ -333,7 +456,9 @@ class ULoRa:
         :return: IRQ flags value.
         """
         irq_flags = self.read_register(REG_IRQ_FLAGS)
-        self.write_register(REG_IRQ_FLAGS, irq_flags)
+        # Flags are write-1-to-clear; nothing to clear when none are set
+        if irq_flags:
+            self.write_register(REG_IRQ_FLAGS, irq_flags)
         return irq_flags
     
     def packet_rssi(self, high_frequency=True):
@@ -354,20 +479,50 @@ class ULoRa:
         """
         return self.read_register(REG_PKT_SNR_VALUE) * 0.25
     
+    def _on_dio0(self, pin):
+        """
+        DIO0 interrupt handler; only flags the event (no allocation).
+        """
+        self._dio0_event = True
+    
     # ---------------------------
     # Module Mode Methods
     # ---------------------------
-    def standby(self):
+    def standby(self, wait=True):
         """
         Set the module to standby mode.
+        
+        :param wait: If True, wait until the mode change has taken effect.
+        :return: False if waiting timed out, otherwise True.
         """
-        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_STDBY)
+        return self._set_mode(MODE_STDBY, wait)
     
-    def sleep(self):
+    def sleep(self, wait=False):
         """
         Put the module into sleep mode.
+        
+        :param wait: If True, wait until the mode change has taken effect
+                     (needed before writing configuration registers).
+        :return: False if waiting timed out, otherwise True.
         """
-        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_SLEEP)
+        return self._set_mode(MODE_SLEEP, wait)
+    
+    def _set_mode(self, mode, wait=True):
+        """
+        Write the operating mode (LoRa mode bit included).
+        
+        :param mode: One of the MODE_* values.
+        :param wait: If True, poll REG_OP_MODE for at most MODE_READY_TIMEOUT_MS.
+        :return: False if waiting timed out, otherwise True.
+        """
+        value = MODE_LONG_RANGE_MODE | mode
+        self.write_register(REG_OP_MODE, value)
+        if wait:
+            start = ticks_ms()
+            while self.read_register(REG_OP_MODE) != value:
+                if ticks_diff(ticks_ms(), start) > MODE_READY_TIMEOUT_MS:
+                    return False
+        return True
     
     # ---------------------------
     # Configuration Methods
@@ -395,10 +550,16 @@ class ULoRa:
         """
         self.parameters["frequency"] = frequency
         frequency += self.parameters["frequency_offset"]
-        frf = (frequency << 19) // 32000000
-        self.write_register(REG_FRF_MSB, (frf >> 16) & 0xFF)
-        self.write_register(REG_FRF_MID, (frf >> 8) & 0xFF)
-        self.write_register(REG_FRF_LSB, frf & 0xFF)
+        frf = _frf(frequency)
+        if frf == self._last_frf:
+            return
+        self._last_frf = frf
+        # FRF_MSB/MID/LSB are adjacent: send all three in one burst
+        buf = self._frf_buf
+        buf[0] = (frf >> 16) & 0xFF
+        buf[1] = (frf >> 8) & 0xFF
+        buf[2] = frf & 0xFF
+        self._write_burst(REG_FRF_MSB, buf)
     
     def set_spreading_factor(self, sf):
         """
@@ -413,7 +574,7 @@ class ULoRa:
         else:
             self.write_register(REG_DETECTION_OPTIMIZE, 0xC3)
             self.write_register(REG_DETECTION_THRESHOLD, 0x0A)
-        current = self.read_register(REG_MODEM_CONFIG_2) & 0x0F
+        current = self._read_shadow(REG_MODEM_CONFIG_2) & 0x0F
         self.write_register(REG_MODEM_CONFIG_2, current | ((sf << 4) & 0xF0))
     
     def set_signal_bandwidth(self, sbw):
@@ -422,17 +583,18 @@ class ULoRa:
         
         :param sbw: Bandwidth in Hz.
         """
-        # Predefined bandwidth bins
-        bins = (7800, 10400, 15600, 20800, 31250, 41700, 62500, 125000, 250000)
-        bw_index = 7  # Default to 125 kHz
         if sbw < 10:
             bw_index = int(sbw)
         else:
-            for i, bw in enumerate(bins):
-                if sbw <= bw:
-                    bw_index = i
-                    break
-        current = self.read_register(REG_MODEM_CONFIG_1) & 0x0F
+            bw_index = SIGNAL_BANDWIDTH_INDEX.get(int(sbw))
+            if bw_index is None:
+                # Not a canonical bandwidth: round up to the next bin
+                bw_index = 7  # Default to 125 kHz
+                for i, bw in enumerate(SIGNAL_BANDWIDTH_BINS):
+                    if sbw <= bw:
+                        bw_index = i
+                        break
+        current = self._read_shadow(REG_MODEM_CONFIG_1) & 0x0F
         self.write_register(REG_MODEM_CONFIG_1, current | (bw_index << 4))
     
     def set_coding_rate(self, denominator):
@@ -443,7 +605,7 @@ class ULoRa:
         """
         denominator = min(max(denominator, 5), 8)
         cr = denominator - 4
-        current = self.read_register(REG_MODEM_CONFIG_1) & 0xF1
+        current = self._read_shadow(REG_MODEM_CONFIG_1) & 0xF1
         self.write_register(REG_MODEM_CONFIG_1, current | (cr << 1))
     
     def set_preamble_length(self, length):
@@ -461,7 +623,7 @@ class ULoRa:
         
         :param enable_crc: Boolean flag.
         """
-        modem_config_2 = self.read_register(REG_MODEM_CONFIG_2)
+        modem_config_2 = self._read_shadow(REG_MODEM_CONFIG_2)
         if enable_crc:
             config = modem_config_2 | 0x04
         else:
@@ -475,7 +637,7 @@ class ULoRa:
         :param invert: Boolean flag.
         """
         self.parameters["invert_IQ"] = invert
-        current = self.read_register(REG_INVERTIQ)
+        current = self._read_shadow(REG_INVERTIQ)
         if invert:
             new_val = (current & RFLR_INVERTIQ_TX_MASK & RFLR_INVERTIQ_RX_MASK) | RFLR_INVERTIQ_RX_ON | RFLR_INVERTIQ_TX_ON
             self.write_register(REG_INVERTIQ, new_val)
@@ -501,7 +663,7 @@ class ULoRa:
         """
         if self.implicit_header_mode != implicit:
             self.implicit_header_mode = implicit
-            modem_config_1 = self.read_register(REG_MODEM_CONFIG_1)
+            modem_config_1 = self._read_shadow(REG_MODEM_CONFIG_1)
             if implicit:
                 config = modem_config_1 | 0x01
             else:
@@ -518,8 +680,7 @@ class ULoRa:
         :param address: Register address.
         :return: Value read.
         """
-        response = self.transfer(address & 0x7F)
-        return int.from_bytes(response, 'big')
+        return self._transfer(address & 0x7F)
     
     def write_register(self, address, value):
         """
@@ -528,7 +689,65 @@ class ULoRa:
         :param address: Register address.
         :param value: Value to write.
         """
-        self.transfer(address | 0x80, value)
+        if not VOLATILE_REGISTER_FLAGS[address]:
+            self._shadow[address] = value
+            self._shadow_valid[address] = 1
+            if self._deferred is not None:
+                self._deferred.add(address)
+                return
+        self._transfer(address | 0x80, value)
+    
+    def _read_shadow(self, address):
+        """
+        Read a configuration register, using the shadow copy when available.
+        
+        :param address: Register address (must not be volatile).
+        :return: Register value.
+        """
+        if self._shadow_valid[address]:
+            return self._shadow[address]
+        value = self.read_register(address)
+        self._shadow[address] = value
+        self._shadow_valid[address] = 1
+        return value
+    
+    def _write_burst(self, start_addr, values):
+        """
+        Write consecutive (non-volatile) registers in a single SPI burst.
+        
+        :param start_addr: Address of the first register.
+        :param values: Bytes to write, one per register.
+        """
+        deferred = self._deferred
+        for i in range(len(values)):
+            self._shadow[start_addr + i] = values[i]
+            self._shadow_valid[start_addr + i] = 1
+            if deferred is not None:
+                deferred.add(start_addr + i)
+        if deferred is not None:
+            return
+        self._hdr[0] = start_addr | 0x80
+        self.pin_ss.value(0)
+        self.spi.write(self._hdr)
+        self.spi.write(values)
+        self.pin_ss.value(1)
+    
+    def _flush_deferred(self):
+        """
+        Stop batching and write the collected registers, one burst per run
+        of adjacent addresses.
+        """
+        addresses = sorted(self._deferred)
+        self._deferred = None
+        count = len(addresses)
+        i = 0
+        while i < count:
+            j = i + 1
+            while j < count and addresses[j] == addresses[j - 1] + 1:
+                j += 1
+            start = addresses[i]
+            self._write_burst(start, memoryview(self._shadow)[start:start + j - i])
+            i = j
     
     def transfer(self, address, value=0x00):
         """
@@ -538,14 +757,49 @@ class ULoRa:
         :param value: Byte to write.
         :return: Response as a bytearray.
         """
-        response = bytearray(1)
+        self._transfer(address, value)
+        return self._rx[1:2]
+    
+    def _transfer(self, address, value=0x00):
+        """
+        Perform an SPI transfer using the preallocated frame buffers.
+        
+        :param address: Register address.
+        :param value: Byte to write.
+        :return: Response byte.
+        """
+        self._tx[0] = address
+        self._tx[1] = value
+        self.pin_ss.value(0)
+        # Send address and value while reading the response in one frame
+        self.spi.write_readinto(self._tx, self._rx)
+        self.pin_ss.value(1)
+        return self._rx[1]
+    
+    def _fifo_write_burst(self, buf):
+        """
+        Write a buffer to the FIFO in a single SPI burst.
+        
+        :param buf: Data to write (bytes, bytearray or memoryview).
+        """
+        self.pin_ss.value(0)
+        self.spi.write(FIFO_WRITE_HEADER)
+        self.spi.write(buf)
+        self.pin_ss.value(1)
+    
+    def _fifo_read_burst(self, n):
+        """
+        Read bytes from the FIFO in a single SPI burst.
+        
+        :param n: Number of bytes to read.
+        :return: Data read as a memoryview into a reused buffer.
+        """
+        buf = memoryview(self._fifo_buf)[:n]
         self.pin_ss.value(0)
-        # Write the register address
-        self.spi.write(bytes([address]))
-        # Write the value and simultaneously read the response
-        self.spi.write_readinto(bytes([value]), response)
+        self.spi.write(FIFO_READ_HEADER)
+        self.spi.readinto(buf)
         self.pin_ss.value(1)
-        return response
+        return buf
     
     def dump_registers(self):
         """
@@ -561,6 +815,9 @@ class ULoRa:
     def collect_garbage(self):
         """
         Run garbage collection.
+        
+        Not called by the driver itself; call it from the application when
+        a collection pause is acceptable.
         """
         gc.collect()
 